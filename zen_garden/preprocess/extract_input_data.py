@@ -627,7 +627,7 @@ class DataInput:
                 if isinstance(unit_row, str):
                     multiplier = self.unit_handling.get_unit_multiplier(unit_row, attribute_name="capex")
                 else:
-                    multiplier = unit_row.apply(lambda unit: self.unit_handling.get_unit_multiplier(unit, attribute_name="capex"))
+                    multiplier = self.unit_handling.get_unit_multipliers_batch(unit_row, attribute_name="capex")
                 df_input = df_input.astype(float)*multiplier
                 has_unit = True
         return df_input, has_unit
@@ -13,7 +13,7 @@ import linopy as lp
 import re
 import itertools
 from pint import UnitRegistry
-from pint.util import column_echelon_form
+from pint.util import column_echelon_form, UnitsContainer
 from pathlib import Path
 from zen_garden.model.objects.technology.technology import Technology
 from zen_garden.model.objects.carrier.carrier import Carrier
@@ -55,30 +55,57 @@ class UnitHandling:
         self.redefine_standard_units()
         # load additional units
         self.ureg.load_definitions(self.folder_path / "unit_definitions.txt")
+        # caches of parsed units and unit multipliers, keyed by the unit string (invalidated whenever the unit registry changes)
+        self._multiplier_cache = {}
+        self._conversion_cache = {}
+        self._quantity_cache = {}
+        self._dimensionality_cache = {}
 
-        # empty base units and dimensionality matrix
+        # base units and their dimensionality
         self.base_units = {}
-        self.dim_matrix = pd.DataFrame(index=_list_base_unit).astype(int)
         for base_unit in _list_base_unit:
-            dim_unit = self.ureg.get_dimensionality(self.ureg(base_unit))
-            self.base_units[base_unit] = self.ureg(base_unit).dimensionality
-            self.dim_matrix.loc[base_unit, list(dim_unit.keys())] = list(dim_unit.values())
-        self.dim_matrix = self.dim_matrix.fillna(0).astype(int).T
-
-        # check if unit defined twice or more
-        duplicate_units = self.dim_matrix.T.duplicated()
+            # if same unit twice (same order of magnitude and same dimensionality)
+            if base_unit in self.base_units:
+                logging.warning(f"The base unit <{base_unit}> was defined more than once. Duplicates are dropped.")
+                continue
+            self.base_units[base_unit] = self._get_dimensionality(base_unit)
+        self._base_unit_set = frozenset(self.base_units)
+        # dimensionality matrix with dimensions as rows and base units as columns, constructed at once
+        self.dim_matrix = pd.DataFrame({base_unit: dict(dim_unit) for base_unit, dim_unit in self.base_units.items()}).fillna(0).astype(int)
+
+        # check if more than one base unit is defined for the same dimensionality (column appears again in the dimensionality matrix)
+        _, first_occurrence, unique_inverse = np.unique(self.dim_matrix.to_numpy(), axis=1, return_index=True, return_inverse=True)
+        duplicate_units = first_occurrence[unique_inverse.reshape(-1)] != np.arange(self.dim_matrix.shape[1])
         if duplicate_units.any():
-            dim_matrix_duplicate = self.dim_matrix.loc[:, duplicate_units]
-            for duplicate in dim_matrix_duplicate:
-                # if same unit twice (same order of magnitude and same dimensionality)
-                if len(self.dim_matrix[duplicate].shape) > 1:
-                    logging.warning(f"The base unit <{duplicate}> was defined more than once. Duplicates are dropped.")
-                    _duplicateDim = self.dim_matrix[duplicate].T.drop_duplicates().T
-                    self.dim_matrix = self.dim_matrix.drop(duplicate, axis=1)
-                    self.dim_matrix[duplicate] = _duplicateDim
-                else:
-                    raise KeyError(f"More than one base unit defined for dimensionality {self.base_units[duplicate]} (e.g., {duplicate})")
+            duplicate = self.dim_matrix.columns[duplicate_units][0]
+            raise KeyError(f"More than one base unit defined for dimensionality {self.base_units[duplicate]} (e.g., {duplicate})")
         # get linearly dependent units
+        self.dim_analysis = {}
+        # if the dimensionality matrix has full column rank, no base unit depends linearly on the others
+        if np.linalg.matrix_rank(self.dim_matrix.to_numpy()) == self.dim_matrix.shape[1]:
+            self.dim_analysis["dependent_units"] = self.dim_matrix.columns[:0]
+            self.dim_analysis["dependent_dims"] = np.zeros((0, self.dim_matrix.shape[1]))
+        else:
+            self.get_dependent_units()
+        # numpy representation of the dimensionality matrix for fast lookups
+        self.dim_matrix_arr = self.dim_matrix.to_numpy(dtype=np.int64, copy=True)
+        # contiguous transpose (one row per base unit) to compare the dimensionality of input units with the base units
+        self._dim_matrix_arr_t = np.ascontiguousarray(self.dim_matrix_arr.T)
+        self._row_index = {dim: idx for idx, dim in enumerate(self.dim_matrix.index)}
+        self._col_index = {unit: idx for idx, unit in enumerate(self.dim_matrix.columns)}
+        self._independent_units_mask = ~self.dim_matrix.columns.isin(self.dim_analysis["dependent_units"])
+        # LU factorization of the dimensionality matrices, which are invariant for all input units
+        self._dim_matrix_reduced_arr = self.dim_matrix_arr[:, self._independent_units_mask].astype(float)
+        self._lu_reduced = self._lu_factor_if_regular(self._dim_matrix_reduced_arr)
+        self._lu_combinations = {}
+        for unit_combination in itertools.combinations(self.dim_matrix.columns, len(self.dim_matrix.index)):
+            if len(set(unit_combination).difference(set(self.dim_matrix.columns[self._independent_units_mask]))) != 0:
+                combination_columns = [self._col_index[unit] for unit in unit_combination]
+                dim_matrix_reduced_temp = self.dim_matrix_arr[:, combination_columns].astype(float)
+                self._lu_combinations[unit_combination] = (combination_columns, self._lu_factor_if_regular(dim_matrix_reduced_temp))
+
+    def get_dependent_units(self):
+        """ gets the linearly dependent base units and their dimensionality from the column echelon form of the dimensionality matrix """
         M, I, pivot = column_echelon_form(np.array(self.dim_matrix), ntype=float)
         M = np.array(M).squeeze()
         I = np.array(I).squeeze()
@@ -88,7 +115,6 @@ class UnitHandling:
         # index of linearly dependent units in dimensionality matrix
         _idx_pivot = range(len(self.base_units))
         idx_lin_dep_dim_matrix = list(set(_idx_pivot).difference(pivot))
-        self.dim_analysis = {}
         self.dim_analysis["dependent_units"] = self.dim_matrix.columns[idx_lin_dep_dim_matrix]
         dependent_dims = I[idx_lin_dep, :]
         # if only one dependent unit
@@ -108,12 +134,26 @@ class UnitHandling:
         # check that no base unit can be directly constructed from the others (e.g., GJ from GW and hour)
         assert ~UnitHandling.check_pos_neg_boolean(dependent_dims, axis=1), f"At least one of the base units {list(self.base_units.keys())} can be directly constructed from the others"
 
+    @staticmethod
+    def _lu_factor_if_regular(matrix):
+        """ computes the LU factorization of a matrix if it is square and has full rank
+
+        :param matrix: numeric numpy array
+        :return lu_factorization: LU factorization of matrix or None if the matrix is singular """
+        if matrix.shape[0] != matrix.shape[1] or np.linalg.matrix_rank(matrix) != np.size(matrix, 1):
+            return None
+        return sp.linalg.lu_factor(matrix)
+
     def extract_base_units(self):
         """ extracts base units of energy system
 
         :return list_base_units: list of base units """
         if os.path.exists(os.path.join(self.folder_path / "base_units.csv")):
-            list_base_units = pd.read_csv(self.folder_path / "base_units.csv").squeeze().values.tolist()
+            with open(os.path.join(self.folder_path, "base_units.csv"), "r") as f:
+                lines = [line.strip() for line in f if line.strip()]
+            assert len(lines) > 1, f"The file base_units.csv at {self.folder_path} does not contain any base units below its header"
+            # skip header
+            list_base_units = lines[1:]
             logging.warning("DeprecationWarning: Specifying the base units in .csv file format is deprecated. Use a .json file format instead.")
         else:
             with open(os.path.join(self.folder_path, 'base_units.json'), "r") as f:
@@ -130,39 +170,41 @@ class UnitHandling:
         # check if "h" and thus "planck_constant" in unit
         self.check_if_invalid_hourstring(input_unit)
         # create dimensionality vector for input_unit
-        dim_input = self.ureg.get_dimensionality(self.ureg(input_unit))
-        dim_vector = pd.Series(index=self.dim_matrix.index, data=0)
-        missing_dim = set(dim_input.keys()).difference(dim_vector.keys())
-        assert len(missing_dim) == 0, f"No base unit defined for dimensionalities <{missing_dim}>"
-        if len(dim_input) > 0:  # check for content of dim_input to avoid Warning
-            dim_vector[list(dim_input.keys())] = list(dim_input.values())
+        dim_vector = self._get_dim_vector(input_unit)
         # calculate dimensionless combined unit (e.g., tons and kilotons)
-        combined_unit = self.ureg(input_unit).units
+        combined_unit = self._get_quantity(input_unit).units
+        # base units whose dimensionality equals the dimensionality of the input unit (or its inverse)
+        matching_base_units = np.flatnonzero((self._dim_matrix_arr_t == dim_vector).all(axis=1))
+        matching_inverse_base_units = np.flatnonzero((self._dim_matrix_arr_t == -dim_vector).all(axis=1))
         # if unit (with a different multiplier) is already in base units
-        if self.dim_matrix.isin(dim_vector).all(axis=0).any():
-            base_combination = self.dim_matrix.isin(dim_vector).all(axis=0).astype(int)
-            base_unit = self.ureg(self.dim_matrix.columns[self.dim_matrix.isin(dim_vector).all(axis=0)][0])
+        if matching_base_units.size > 0:
+            base_combination = pd.Series(index=self.dim_matrix.columns, data=0)
+            base_combination.iloc[matching_base_units] = 1
+            base_unit = self._get_quantity(self.dim_matrix.columns[matching_base_units[0]])
             combined_unit *= base_unit ** (-1)
         # if inverse of unit (with a different multiplier) is already in base units (e.g. 1/km and km)
-        elif (self.dim_matrix * -1).isin(dim_vector).all(axis=0).any():
-            base_combination = (self.dim_matrix * -1).isin(dim_vector).all(axis=0).astype(int) * (-1)
-            base_unit = self.ureg(self.dim_matrix.columns[(self.dim_matrix * -1).isin(dim_vector).all(axis=0)][0])
+        elif matching_inverse_base_units.size > 0:
+            base_combination = pd.Series(index=self.dim_matrix.columns, data=0)
+            base_combination.iloc[matching_inverse_base_units] = -1
+            base_unit = self._get_quantity(self.dim_matrix.columns[matching_inverse_base_units[0]])
             combined_unit *= base_unit
         else:
             # drop dependent units
-            dim_matrix_reduced = self.dim_matrix.drop(self.dim_analysis["dependent_units"], axis=1)
+            independent_units = self.dim_matrix.columns[self._independent_units_mask]
             # solve system of linear equations
-            combination_solution = np.linalg.solve(dim_matrix_reduced, dim_vector)
-            # check if only -1, 0, 1
-            if UnitHandling.check_pos_neg_boolean(combination_solution):
+            if self._lu_reduced is not None:
+                combination_solution = sp.linalg.lu_solve(self._lu_reduced, dim_vector)
+            else:
+                combination_solution = np.linalg.solve(self._dim_matrix_reduced_arr, dim_vector)
+            # check if only -1, 0, 1 (up to numerical noise of the solver)
+            combination_powers = UnitHandling._get_pos_neg_boolean_powers(combination_solution)
+            if combination_powers is not None:
                 base_combination = pd.Series(index=self.dim_matrix.columns, data=0)
-                base_combination[dim_matrix_reduced.columns] = combination_solution
-                # compose relevant units to dimensionless combined unit
-                for unit, power in zip(dim_matrix_reduced.columns, combination_solution):
-                    combined_unit *= self.ureg(unit) ** (-1 * power)
+                base_combination[independent_units] = combination_powers
+                # compose relevant units to dimensionless combined unit (integer powers are cheaper in pint)
+                combined_unit *= self._compose_base_units(independent_units, [-power for power in combination_powers])
             else:
                 base_combination,combined_unit = self._get_combined_unit_of_different_matrix(
-                    dim_matrix_reduced= dim_matrix_reduced,
                     dim_vector=dim_vector,
                     input_unit=input_unit
                 )
@@ -171,61 +213,106 @@ class UnitHandling:
         else:
             return combined_unit
 
-    def _get_combined_unit_of_different_matrix(self, dim_matrix_reduced, dim_vector, input_unit):
+    def _get_combined_unit_of_different_matrix(self, dim_vector, input_unit):
         """ calculates the combined unit for a different dimensionality matrix.
         We substitute base units by the dependent units and try again.
         If the matrix is singular we solve the overdetermined problem
 
-        :param dim_matrix_reduced: dimensionality matrix without dependent units
         :param dim_vector: dimensionality vector of input unit
         :param input_unit: input unit
         :return base_combination: base combination of input unit
         :return combined_unit: input unit expressed in base units
         """
-        calculated_multiplier = False
-        combined_unit = self.ureg(input_unit).units
-        base_combination = pd.Series(index=self.dim_matrix.columns, data=0)
         # try to substitute unit by a dependent unit
-        for unit_combination in itertools.combinations(self.dim_matrix.columns, len(self.dim_matrix.index)):
-            if not calculated_multiplier and len(set(unit_combination).difference(set(dim_matrix_reduced.columns))) != 0:
-                # use reduced matrix based on the unit_combination
-                dim_matrix_reduced_temp = self.dim_matrix.loc[:, unit_combination]
-                # if full rank
-                if np.linalg.matrix_rank(dim_matrix_reduced_temp) == np.size(dim_matrix_reduced_temp, 1):
-                    combination_solution_temp = np.linalg.solve(dim_matrix_reduced_temp, dim_vector)
-                # if singular, check if zero row in matrix corresponds to zero row in unit dimensionality
-                else:
-                    zero_row = dim_matrix_reduced_temp.index[~dim_matrix_reduced_temp.any(axis=1)]
-                    if (dim_vector[zero_row] == 0).all():
-                        # remove zero row
-                        dim_matrix_reduced_temp_reduced = dim_matrix_reduced_temp.drop(zero_row, axis=0)
-                        dim_vector_reduced = dim_vector.drop(zero_row, axis=0)
-                        # formulate as optimization problem with 1,-1 bounds
-                        # to determine solution of overdetermined matrix
-                        ub = np.array([1] * len(dim_matrix_reduced_temp_reduced.columns))
-                        lb = np.array([-1] * len(dim_matrix_reduced_temp_reduced.columns))
-                        res = sp.optimize.lsq_linear(
-                            dim_matrix_reduced_temp_reduced, dim_vector_reduced,
-                            bounds=(lb, ub))
-                        # if an exact solution is found (after rounding)
-                        if np.round(res.cost, 4) == 0:
-                            combination_solution_temp = np.round(res.x, 4)
-                        # if not solution is found
-                        else:
-                            continue
-                    # definitely not a solution because zero row corresponds to nonzero dimensionality
-                    else:
-                        continue
-                if UnitHandling.check_pos_neg_boolean(combination_solution_temp):
-                    # compose relevant units to dimensionless combined unit
-                    base_combination[dim_matrix_reduced_temp.columns] = combination_solution_temp
-                    for unit_temp, power_temp in zip(dim_matrix_reduced_temp.columns, combination_solution_temp):
-                        combined_unit *= self.ureg(unit_temp) ** (-1 * power_temp)
-                    calculated_multiplier = True
-                    break
+        combination_solution, combination_columns, calculated_multiplier = UnitHandling._resolve_with_dependents(
+            dim_matrix_arr=self.dim_matrix_arr,
+            lu_combinations=self._lu_combinations.values(),
+            dim_vector=dim_vector
+        )
         assert calculated_multiplier, f"Cannot establish base unit conversion for {input_unit} from base units {self.base_units.keys()}"
+        # compose relevant units to dimensionless combined unit
+        combined_unit = self._get_quantity(input_unit).units
+        base_combination = pd.Series(index=self.dim_matrix.columns, data=0)
+        combination_units = self.dim_matrix.columns[combination_columns]
+        base_combination[combination_units] = combination_solution
+        combined_unit *= self._compose_base_units(combination_units, [-power for power in combination_solution])
         return base_combination,combined_unit
 
+    @staticmethod
+    def _resolve_with_dependents(dim_matrix_arr, lu_combinations, dim_vector):
+        """ solves the dimensionality of an input unit for the first combination of base units that yields only powers of -1, 0, 1
+
+        :param dim_matrix_arr: dimensionality matrix as numpy array
+        :param lu_combinations: column indices of the base unit combinations and their LU factorization (None if singular)
+        :param dim_vector: dimensionality vector of input unit
+        :return combination_solution: integer powers of the base units in the combination
+        :return combination_columns: column indices of the base units in the combination
+        :return success: True if a combination was found """
+        for combination_columns, lu_combination in lu_combinations:
+            # if full rank, use precomputed factorization of the reduced matrix based on the unit combination
+            if lu_combination is not None:
+                combination_solution = sp.linalg.lu_solve(lu_combination, dim_vector)
+            # if singular, check if zero row in matrix corresponds to zero row in unit dimensionality
+            else:
+                dim_matrix_reduced_temp = dim_matrix_arr[:, combination_columns]
+                zero_row = ~dim_matrix_reduced_temp.any(axis=1)
+                # definitely not a solution because zero row corresponds to nonzero dimensionality
+                if not (dim_vector[zero_row] == 0).all():
+                    continue
+                # formulate as optimization problem with 1,-1 bounds to determine solution of overdetermined matrix
+                ub = np.array([1] * len(combination_columns))
+                lb = np.array([-1] * len(combination_columns))
+                res = sp.optimize.lsq_linear(dim_matrix_reduced_temp[~zero_row, :], dim_vector[~zero_row], bounds=(lb, ub))
+                # if not solution is found (after rounding)
+                if np.round(res.cost, 4) != 0:
+                    continue
+                combination_solution = np.round(res.x, 4)
+            combination_powers = UnitHandling._get_pos_neg_boolean_powers(combination_solution)
+            if combination_powers is not None:
+                return combination_powers, combination_columns, True
+        return None, None, False
+
+    @staticmethod
+    def _get_pos_neg_boolean_powers(combination_solution, tolerance=1e-9):
+        """ rounds the solution of the linear system of the dimensionalities and checks if it only contains -1, 0, 1 (up to numerical noise of the solver)
+
+        :param combination_solution: numeric numpy array of solved base unit powers
+        :param tolerance: maximum deviation of the solution from the rounded powers
+        :return combination_powers: list of integer powers or None if the solution is not -1, 0, 1 """
+        combination_solution_rounded = np.round(combination_solution)
+        if np.all(np.abs(combination_solution - combination_solution_rounded) < tolerance) and np.all(np.abs(combination_solution_rounded) <= 1):
+            return combination_solution_rounded.astype(int).tolist()
+        return None
+
+    def _compose_base_units(self, units, powers):
+        """ composes base units with the given powers to a single pint Quantity, merging the unit exponents at once
+
+        :param units: base units to compose
+        :param powers: powers of the base units
+        :return composed_unit: pint Quantity of the composed base units """
+        magnitude = 1
+        exponents = {}
+        for unit, power in zip(units, powers):
+            if power == 0:
+                continue
+            unit_magnitude, unit_items = self._get_quantity(unit).to_tuple()
+            magnitude *= unit_magnitude ** power
+            for name, exponent in unit_items:
+                exponents[name] = exponents.get(name, 0) + exponent * power
+        return self.ureg.Quantity(magnitude, UnitsContainer({name: exponent for name, exponent in exponents.items() if exponent != 0}))
+
+    def _get_dim_vector(self, input_unit):
+        """ creates the dimensionality vector of an input unit with the dimensions of the dimensionality matrix
+
+        :param input_unit: string of input unit
+        :return dim_vector: dimensionality vector of input unit """
+        dim_input = self._get_dimensionality(input_unit)
+        dim_vector = np.zeros(len(self._row_index), dtype=np.float64)
+        for dim, power in dim_input.items():
+            assert dim in self._row_index, f"No base unit defined for dimensionalities <{set(dim_input.keys()).difference(self._row_index)}>"
+            dim_vector[self._row_index[dim]] = power
+        return dim_vector
+
     #ToDo: check if combined_unit is described correctly in the header
     def get_unit_multiplier(self, input_unit, attribute_name, path=None, combined_unit=None):
         """ calculates the multiplier for converting an input_unit to the base units
@@ -236,7 +323,7 @@ class UnitHandling:
         :param combined_unit: input unit expressed in base units
         :return multiplier: multiplication factor """
         # if input unit is already in base units --> the input unit is base unit, multiplier = 1
-        if input_unit in self.base_units:
+        if isinstance(input_unit, str) and input_unit in self._base_unit_set:
             return 1
         # if input unit is nan --> dimensionless old definition
         elif type(input_unit) != str and np.isnan(input_unit):
@@ -248,15 +335,33 @@ class UnitHandling:
             # if input unit is 1 --> dimensionless new definition
             if input_unit == "1":
                 return 1
-            if not combined_unit:
+            # return multiplier if unit was already converted before
+            cache_key = input_unit.strip()
+            if cache_key in self._multiplier_cache:
+                return self._multiplier_cache[cache_key]
+            if combined_unit is None:
                 combined_unit = self.calculate_combined_unit(input_unit)
-            assert combined_unit.to_base_units().unitless, f"The unit conversion of unit {input_unit} did not resolve to a dimensionless conversion factor. Something went wrong."
+            combined_unit = combined_unit.to_base_units()
+            assert combined_unit.unitless, f"The unit conversion of unit {input_unit} did not resolve to a dimensionless conversion factor. Something went wrong."
             # magnitude of combined unit is multiplier
-            multiplier = combined_unit.to_base_units().magnitude
+            multiplier = combined_unit.magnitude
             # check that multiplier is larger than rounding tolerance
             assert multiplier >= 10 ** (-self.rounding_decimal_points_units), f"Multiplier {multiplier} of unit {input_unit} in parameter {attribute_name} is smaller than rounding tolerance {10 ** (-self.rounding_decimal_points_units)}"
             # round to decimal points
-            return round(multiplier, self.rounding_decimal_points_units)
+            multiplier = round(multiplier, self.rounding_decimal_points_units)
+            self._multiplier_cache[cache_key] = multiplier
+            return multiplier
+
+    def get_unit_multipliers_batch(self, input_units, attribute_name, path=None):
+        """ calculates the multipliers for converting a series of input_units to the base units. Each distinct unit is only converted once
+
+        :param input_units: pd.Series of input units
+        :param attribute_name: name of attribute
+        :param path: path of element
+        :return multipliers: np.ndarray of multiplication factors """
+        codes, unique_units = pd.factorize(input_units, use_na_sentinel=False)
+        unique_multipliers = np.array([self.get_unit_multiplier(unit, attribute_name, path) for unit in unique_units], dtype=float)
+        return unique_multipliers[codes]
 
     def convert_unit_into_base_units(self, input_unit, get_multiplier=False, attribute_name=None, path=None):
         """Converts the input_unit into base units and returns the multiplier such that the combined unit mustn't be computed twice
@@ -267,13 +372,18 @@ class UnitHandling:
         :param get_multiplier: bool whether multiplier should be returned or not
         :return: multiplier to convert input_unit to base  units, pint Quantity of input_unit converted to base units
         """
-        # convert attribute unit into unit combination of base units
-        combined_unit = None
-        attribute_unit_in_base_units = self.ureg("")
-        if input_unit != "1" and not pd.isna(input_unit):
-            combined_unit, base_combination = self.calculate_combined_unit(input_unit, return_combination=True)
-            for unit, power in zip(base_combination.index, base_combination):
-                attribute_unit_in_base_units *= self.ureg(unit) ** power
+        # convert attribute unit into unit combination of base units (only once per unit string)
+        cache_key = input_unit.strip() if isinstance(input_unit, str) else None
+        if cache_key is not None and cache_key in self._conversion_cache:
+            combined_unit, attribute_unit_in_base_units = self._conversion_cache[cache_key]
+        else:
+            combined_unit = None
+            attribute_unit_in_base_units = self.ureg("")
+            if input_unit != "1" and not pd.isna(input_unit):
+                combined_unit, base_combination = self.calculate_combined_unit(input_unit, return_combination=True)
+                attribute_unit_in_base_units = self._compose_base_units(base_combination.index, base_combination)
+            if cache_key is not None:
+                self._conversion_cache[cache_key] = (combined_unit, attribute_unit_in_base_units)
         # calculate the multiplier to convert the attribute unit into base units
         if get_multiplier:
             multiplier = self.get_unit_multiplier(input_unit, attribute_name, path, combined_unit=combined_unit)
@@ -634,13 +744,39 @@ class UnitHandling:
 
         :param input_unit: string of input_unit
         """
-        _tuple_units = self.ureg(input_unit).to_tuple()[1]
+        # only parse the unit if it contains a (prefixed) standalone "h" or the planck constant itself
+        if not re.search(r"(?<![A-Za-z_])[A-Za-zµ]{0,2}h(?![A-Za-z_])|ℎ|planck_constant", input_unit):
+            return
+        _tuple_units = self._get_quantity(input_unit).to_tuple()[1]
         _list_units = [_item[0] for _item in _tuple_units]
         assert "planck_constant" not in _list_units, f"Error in input unit '{input_unit}'. Did you want to define hour? Use 'hour' instead of 'h' ('h' is interpreted as the planck constant)"
 
+    def _get_quantity(self, unit):
+        """ parses a unit string to a pint Quantity. Parsed units are cached since the same units are parsed repeatedly
+
+        :param unit: string of unit
+        :return quantity: pint Quantity of unit """
+        if unit not in self._quantity_cache:
+            self._quantity_cache[unit] = self.ureg(unit)
+        return self._quantity_cache[unit]
+
+    def _get_dimensionality(self, unit):
+        """ returns the (cached) dimensionality of a unit string
+
+        :param unit: string of unit
+        :return dimensionality: dimensionality of unit """
+        if unit not in self._dimensionality_cache:
+            self._dimensionality_cache[unit] = self.ureg.get_dimensionality(self._get_quantity(unit))
+        return self._dimensionality_cache[unit]
+
     def define_ton_as_metric(self):
         """ redefines the "ton" as a metric ton """
         self.ureg.define("ton = metric_ton")
+        # registry changed --> cached units and multipliers are outdated
+        self._multiplier_cache = {}
+        self._conversion_cache = {}
+        self._quantity_cache = {}
+        self._dimensionality_cache = {}
 
     def redefine_standard_units(self):
         """ defines the standard units always required in ZEN and removes the rounding error for leap years."""
@@ -655,10 +791,16 @@ class UnitHandling:
         :param array: numeric numpy array
         :param axis: axis of dataframe
         :return is_pos_neg_boolean: """
+        array = np.asarray(array)
+        if array.dtype.kind in "iu":
+            mask = (array >= -1) & (array <= 1)
+        else:
+            abs_array = np.abs(array)
+            mask = (abs_array <= 1) & (abs_array == abs_array.astype(np.int8))
         if axis:
-            is_pos_neg_boolean = np.apply_along_axis(lambda row: np.array_equal(np.abs(row), np.abs(row).astype(bool)), 1, array).any()
+            is_pos_neg_boolean = mask.all(axis=1).any()
         else:
-            is_pos_neg_boolean = np.array_equal(np.abs(array), np.abs(array).astype(bool))
+            is_pos_neg_boolean = mask.all()
         return is_pos_neg_boolean
 
 